@@ -7,18 +7,54 @@ with current and historical currency information for all countries.
 """
 
 import requests
-import pandas as pd
-import xml.etree.ElementTree as ET
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import csv
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
 from datetime import datetime, timezone, date
 import json
 import os
+import sys
+import shutil
 import logging
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 import pycountry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration
 GENERATOR_VERSION = "1.2.0"
 CLDR_DATA_URL = "https://raw.githubusercontent.com/unicode-org/cldr/main/common/supplemental/supplementalData.xml"
+CLDR_CACHE_PATH = "data/.cldr_cache.xml"
+CLDR_ETAG_PATH = "data/.cldr_cache.etag"
+CURRENT_CSV_FIELDS = [
+    'country_code', 'country_name', 'official_country_name', 'iso_alpha3_code',
+    'currency_code', 'currency_name', 'active_since', 'last_updated'
+]
+HISTORICAL_CSV_FIELDS = [
+    'country_code', 'country_name', 'official_country_name', 'iso_alpha3_code',
+    'currency_code', 'currency_name', 'active_from', 'active_until', 'status', 'last_updated'
+]
+
+# Reference data records; only the fields read by the generators are kept
+CountryInfo = namedtuple('CountryInfo', 'name official_name alpha_3')
+CurrencyInfo = namedtuple('CurrencyInfo', 'name numeric')
+
+# Shared HTTP session: reuses connections and retries transient failures
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(max_retries=Retry(
+    total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)
+)))
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -28,19 +64,16 @@ class CurrencyDataProcessor:
     def __init__(self):
         self.iso3166_data = {}
         self.iso4217_data = {}
+        self.iso4217_names = {}
         self.currency_regions = {}
         
-    def fetch_iso3166_data(self) -> Dict:
+    def fetch_iso3166_data(self) -> Dict[str, CountryInfo]:
         """Fetch ISO 3166 country codes and names from pycountry"""
         try:
-            countries = {}
-            for country in pycountry.countries:
-                countries[country.alpha_2] = {
-                    'alpha_2': country.alpha_2,
-                    'alpha_3': country.alpha_3,
-                    'name': country.name,
-                    'official_name': getattr(country, 'official_name', country.name)
-                }
+            countries = {
+                country.alpha_2: CountryInfo(country.name, getattr(country, 'official_name', country.name), country.alpha_3)
+                for country in pycountry.countries
+            }
             
             logger.info(f"Fetched {len(countries)} ISO 3166 countries/territories")
             return countries
@@ -48,16 +81,13 @@ class CurrencyDataProcessor:
             logger.error(f"Failed to fetch ISO 3166 data: {e}")
             return {}
     
-    def fetch_iso4217_data(self) -> Dict:
+    def fetch_iso4217_data(self) -> Dict[str, CurrencyInfo]:
         """Fetch ISO 4217 currency codes and names"""
         try:
-            currencies = {}
-            for currency in pycountry.currencies:
-                currencies[currency.alpha_3] = {
-                    'code': currency.alpha_3,
-                    'name': currency.name,
-                    'numeric': currency.numeric
-                }
+            currencies = {
+                currency.alpha_3: CurrencyInfo(currency.name, currency.numeric)
+                for currency in pycountry.currencies
+            }
             
             logger.info(f"Fetched {len(currencies)} ISO 4217 currencies")
             return currencies
@@ -65,45 +95,92 @@ class CurrencyDataProcessor:
             logger.error(f"Failed to fetch ISO 4217 data: {e}")
             return {}
     
-    def fetch_cldr_currency_data(self) -> str:
-        """Fetch the latest CLDR currency data XML"""
+    def fetch_cldr_currency_data(self):
+        """Fetch the latest CLDR currency data XML, reusing the on-disk copy when unchanged"""
+        headers = {}
+        if os.path.exists(CLDR_CACHE_PATH) and os.path.exists(CLDR_ETAG_PATH):
+            with open(CLDR_ETAG_PATH) as f:
+                headers['If-None-Match'] = f.read().strip()
         
         try:
-            response = requests.get(CLDR_DATA_URL, timeout=30)
+            response = SESSION.get(CLDR_DATA_URL, headers=headers, stream=True, timeout=30)
             response.raise_for_status()
-            logger.info("Successfully fetched CLDR currency data")
-            return response.text
         except requests.RequestException as e:
             logger.error(f"Failed to fetch CLDR data: {e}")
             raise
+        
+        with response:
+            if response.status_code == 304:
+                logger.info("CLDR currency data not modified, using cached copy")
+                return open(CLDR_CACHE_PATH, 'rb')
+            
+            # Stream the body into the cache before recording its ETag
+            response.raw.decode_content = True
+            tmp_path = CLDR_CACHE_PATH + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f)
+            os.replace(tmp_path, CLDR_CACHE_PATH)
+            
+            etag = response.headers.get('ETag')
+            if etag:
+                with open(CLDR_ETAG_PATH, 'w') as f:
+                    f.write(etag)
+            elif os.path.exists(CLDR_ETAG_PATH):
+                os.remove(CLDR_ETAG_PATH)
+        
+        logger.info("Successfully fetched CLDR currency data")
+        return open(CLDR_CACHE_PATH, 'rb')
     
-    def parse_currency_xml(self, xml_content: str) -> Dict:
-        """Parse the CLDR XML and extract currency information"""
+    def parse_currency_xml(self, stream) -> Dict:
+        """Parse the CLDR XML stream and extract currency information"""
         try:
-            root = ET.fromstring(xml_content)
             currency_data = {}
+            in_currency_data = False
+            found_currency_data = False
             
-            # Navigate to CLDR currency data structure
-            currency_data_elem = root.find('.//currencyData')
-            if currency_data_elem is None:
-                raise ValueError("Could not find currencyData section in XML")
+            # Stream region elements instead of building the whole tree; lxml can
+            # filter by tag in C, the stdlib parser reports every element
+            if HAS_LXML:
+                context = ET.iterparse(stream, events=('start', 'end'), tag=('region', 'currencyData'))
+            else:
+                context = ET.iterparse(stream, events=('start', 'end'))
             
-            for region_elem in currency_data_elem.findall('.//region'):
-                region_code = region_elem.get('iso3166')
-                if not region_code:
+            for event, elem in context:
+                if elem.tag == 'currencyData':
+                    if event == 'start':
+                        in_currency_data = True
+                        continue
+                    # Nothing after currencyData is needed, stop reading
+                    found_currency_data = True
+                    break
+                
+                if event != 'end' or elem.tag != 'region' or not in_currency_data:
                     continue
                 
-                currencies = []
-                for currency_elem in region_elem.findall('currency'):
-                    currency_info = {
-                        'iso4217': currency_elem.get('iso4217'),
-                        'from': currency_elem.get('from'),
-                        'to': currency_elem.get('to'),
-                        'tender': currency_elem.get('tender', 'true')
-                    }
-                    currencies.append(currency_info)
+                region_code = elem.get('iso3166')
+                if region_code:
+                    # Columnar layout: one list per attribute, indexed by position
+                    currencies = {'iso4217': [], 'from': [], 'to': [], 'tender': []}
+                    for currency_elem in elem:
+                        if currency_elem.tag != 'currency':
+                            continue
+                        iso4217 = currency_elem.get('iso4217')
+                        currencies['iso4217'].append(sys.intern(iso4217) if iso4217 else iso4217)
+                        currencies['from'].append(currency_elem.get('from'))
+                        currencies['to'].append(currency_elem.get('to'))
+                        currencies['tender'].append(currency_elem.get('tender', 'true'))
+                    
+                    currency_data[region_code] = currencies
                 
-                currency_data[region_code] = currencies
+                # Free parsed regions to keep memory flat; lxml can also drop the
+                # completed siblings themselves
+                elem.clear()
+                if HAS_LXML:
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+            
+            if not found_currency_data:
+                raise ValueError("Could not find currencyData section in XML")
             
             logger.info(f"Parsed currency data for {len(currency_data)} regions")
             return currency_data
@@ -111,212 +188,159 @@ class CurrencyDataProcessor:
             logger.error(f"Failed to parse XML: {e}")
             raise
     
-    def determine_current_currency(self, currencies: List[Dict]) -> Optional[Dict]:
-        """Determine the current currency for a region"""
-        current_date = date.today().strftime('%Y-%m-%d')
+    def resolve_currencies(self, currencies: Dict[str, List], current_date: str) -> Tuple[Optional[int], List[int]]:
+        """Determine the position of the current currency as of current_date (YYYY-MM-DD)
+        and the positions of the complete tender timeline for a region in a single scan"""
+        starts = currencies['from']
+        ends = currencies['to']
+        current_index = None
+        timeline = []
         
-        for currency in currencies:
+        for i, tender in enumerate(currencies['tender']):
             # Exclude non-tender currencies (commemorative, etc.)
-            if currency['tender'] == 'false':
+            if tender == 'false':
                 continue
-                
-            # Active currency: no end date specified
-            if not currency['to']:
-                return currency
             
-            # Check if currency is still within valid date range
-            to_date = currency['to']
-            if to_date >= current_date:
-                return currency
-        
-        return None
-    
-    def get_all_currencies(self, currencies: List[Dict]) -> List[Dict]:
-        """Get ALL currencies for a region (both active and historical with complete timeline)"""
-        all_currencies = []
-        
-        for currency in currencies:
-            if currency['tender'] == 'false':
-                continue
-                
-            all_currencies.append(currency)
-        
-        return sorted(all_currencies, key=lambda x: x['from'] or '0000-01-01')
-    
-    def is_valid_region(self, region_code: str, country_info: Dict) -> bool:
-        """Check if region has valid ISO data and should be included"""
-        country_name = country_info.get('name', 'Unknown')
-        
-        # Filter out regions without proper ISO 3166 recognition
-        if country_name in ['Unknown', ''] or not country_name:
-            return False
-            
-        if not country_info:
-            return False
-            
-        return True
-
-    def generate_current_currencies_csv(self, currency_data: Dict) -> pd.DataFrame:
-        """Generate CSV data for current currencies"""
-        rows = []
-        
-        for region_code, currencies in currency_data.items():
-            country_info = self.iso3166_data.get(region_code, {})
+            # First currency in CLDR order that has no end date or is still
+            # within its valid date range
+            if current_index is None and (not ends[i] or ends[i] >= current_date):
+                current_index = i
             
-            if not self.is_valid_region(region_code, country_info):
-                continue
-                
-            current_currency = self.determine_current_currency(currencies)
-            
-            if current_currency:
-                currency_info = self.iso4217_data.get(current_currency['iso4217'], {})
-                
-                row = {
-                    'country_code': region_code,
-                    'country_name': country_info.get('name'),
-                    'official_country_name': country_info.get('official_name', country_info.get('name')),
-                    'iso_alpha3_code': country_info.get('alpha_3', ''),
-                    'currency_code': current_currency['iso4217'],
-                    'currency_name': currency_info.get('name', current_currency['iso4217']),
-                    'active_since': current_currency['from'] or 'Unknown',
-                    'last_updated': datetime.now(timezone.utc).isoformat()
-                }
-                rows.append(row)
+            timeline.append(i)
         
-        return pd.DataFrame(rows)
+        timeline.sort(key=lambda i: starts[i] or '0000-01-01')
+        return current_index, timeline
     
-    def generate_historical_currencies_csv(self, currency_data: Dict) -> pd.DataFrame:
-        """Generate CSV data for ALL currencies (complete historical timeline)"""
-        rows = []
+    def build_all_outputs(self, currency_data: Dict) -> Tuple[List[Dict], List[Dict], Dict, Dict]:
+        """Generate current/historical CSV rows and JSON data in a single pass over all regions"""
+        current_rows = []
+        historical_rows = []
+        current_json = {}
+        historical_json = {}
+        last_updated = datetime.now(timezone.utc).isoformat()
         current_date = date.today().strftime('%Y-%m-%d')
         
         for region_code, currencies in currency_data.items():
-            country_info = self.iso3166_data.get(region_code, {})
-            
-            if not self.is_valid_region(region_code, country_info):
+            # Regions without ISO 3166 recognition are not included
+            country_info = self.iso3166_data.get(region_code)
+            if not country_info:
                 continue
-                
-            all_currencies = self.get_all_currencies(currencies)
             
-            for currency in all_currencies:
-                currency_info = self.iso4217_data.get(currency['iso4217'], {})
-                
-                if not currency['to']:
-                    status = 'Active'
-                elif currency['to'] >= current_date:
-                    status = 'Active'
-                else:
-                    status = 'Historical'
-                
-                row = {
-                    'country_code': region_code,
-                    'country_name': country_info.get('name'),
-                    'official_country_name': country_info.get('official_name', country_info.get('name')),
-                    'iso_alpha3_code': country_info.get('alpha_3', ''),
-                    'currency_code': currency['iso4217'],
-                    'currency_name': currency_info.get('name', currency['iso4217']),
-                    'active_from': currency['from'] or 'Unknown',
-                    'active_until': currency['to'] or '',
-                    'status': status,
-                    'last_updated': datetime.now(timezone.utc).isoformat()
-                }
-                
-                rows.append(row)
-        
-        df = pd.DataFrame(rows)
-        # Sort: country alphabetically, active currencies first, then chronologically
-        if not df.empty:
-            df = df.sort_values(['country_code', 'status', 'active_from'], 
-                              ascending=[True, False, True])
-        return df
-    
-    def generate_current_currencies_json(self, currency_data: Dict) -> Dict:
-        """Generate JSON data for current currencies"""
-        data = {}
-        
-        for region_code, currencies in currency_data.items():
-            country_info = self.iso3166_data.get(region_code, {})
+            country_name = country_info.name
+            official_country_name = country_info.official_name
+            iso_alpha3_code = country_info.alpha_3
             
-            if not self.is_valid_region(region_code, country_info):
-                continue
-                
-            current_currency = self.determine_current_currency(currencies)
+            codes = currencies['iso4217']
+            starts = currencies['from']
+            ends = currencies['to']
+            current_index, timeline = self.resolve_currencies(currencies, current_date)
             
-            if current_currency:
-                currency_info = self.iso4217_data.get(current_currency['iso4217'], {})
+            if current_index is not None:
+                currency_code = codes[current_index]
+                currency_name = self.iso4217_names.get(currency_code, currency_code)
+                active_since = starts[current_index] or 'Unknown'
                 
-                data[region_code] = {
-                    'country_name': country_info.get('name'),
-                    'official_country_name': country_info.get('official_name', country_info.get('name')),
-                    'iso_alpha3_code': country_info.get('alpha_3', ''),
-                    'currency_code': current_currency['iso4217'],
-                    'currency_name': currency_info.get('name', current_currency['iso4217']),
-                    'active_since': current_currency['from'] or 'Unknown'
-                }
-        
-        return data
-    
-    def generate_historical_currencies_json(self, currency_data: Dict) -> Dict:
-        """Generate JSON data for ALL currencies (complete historical timeline)"""
-        data = {}
-        current_date = date.today().strftime('%Y-%m-%d')
-        
-        for region_code, currencies in currency_data.items():
-            country_info = self.iso3166_data.get(region_code, {})
-            
-            if not self.is_valid_region(region_code, country_info):
-                continue
+                current_rows.append({
+                    'country_code': region_code,
+                    'country_name': country_name,
+                    'official_country_name': official_country_name,
+                    'iso_alpha3_code': iso_alpha3_code,
+                    'currency_code': currency_code,
+                    'currency_name': currency_name,
+                    'active_since': active_since,
+                    'last_updated': last_updated
+                })
                 
-            all_currencies = self.get_all_currencies(currencies)
+                current_json[region_code] = {
+                    'country_name': country_name,
+                    'official_country_name': official_country_name,
+                    'iso_alpha3_code': iso_alpha3_code,
+                    'currency_code': currency_code,
+                    'currency_name': currency_name,
+                    'active_since': active_since
+                }
             
             currency_list = []
-            for currency in all_currencies:
-                currency_info = self.iso4217_data.get(currency['iso4217'], {})
+            for i in timeline:
+                currency_code = codes[i]
+                currency_name = self.iso4217_names.get(currency_code, currency_code)
+                active_from = starts[i] or 'Unknown'
+                active_until = ends[i] or ''
                 
-                if not currency['to']:
-                    status = 'Active'
-                elif currency['to'] >= current_date:
-                    status = 'Active'
-                else:
-                    status = 'Historical'
+                status = 'Active' if not active_until or active_until >= current_date else 'Historical'
+                
+                historical_rows.append({
+                    'country_code': region_code,
+                    'country_name': country_name,
+                    'official_country_name': official_country_name,
+                    'iso_alpha3_code': iso_alpha3_code,
+                    'currency_code': currency_code,
+                    'currency_name': currency_name,
+                    'active_from': active_from,
+                    'active_until': active_until,
+                    'status': status,
+                    'last_updated': last_updated
+                })
                 
                 currency_list.append({
-                    'currency_code': currency['iso4217'],
-                    'currency_name': currency_info.get('name', currency['iso4217']),
-                    'active_from': currency['from'] or 'Unknown',
-                    'active_until': currency['to'] or '',
+                    'currency_code': currency_code,
+                    'currency_name': currency_name,
+                    'active_from': active_from,
+                    'active_until': active_until,
                     'status': status
                 })
             
             if currency_list:
-                data[region_code] = {
-                    'country_name': country_info.get('name'),
-                    'official_country_name': country_info.get('official_name', country_info.get('name')),
-                    'iso_alpha3_code': country_info.get('alpha_3', ''),
+                historical_json[region_code] = {
+                    'country_name': country_name,
+                    'official_country_name': official_country_name,
+                    'iso_alpha3_code': iso_alpha3_code,
                     'currencies': currency_list
                 }
         
-        return data
+        # Sort: country alphabetically, historical currencies before active ones, then chronologically
+        historical_rows.sort(key=lambda r: (r['country_code'], r['status'] == 'Active', r['active_from']))
+        
+        return current_rows, historical_rows, current_json, historical_json
     
     def generate_iso_mappings(self) -> Dict:
         """Generate simplified ISO mapping formats"""
         return {
-            'countries': {code: data['name'] for code, data in self.iso3166_data.items()},
-            'currencies': {code: data['name'] for code, data in self.iso4217_data.items()},
-            'alpha2_to_alpha3': {code: data['alpha_3'] for code, data in self.iso3166_data.items() if data.get('alpha_3')}
+            'countries': {code: data.name for code, data in self.iso3166_data.items()},
+            'currencies': dict(self.iso4217_names),
+            'alpha2_to_alpha3': {code: data.alpha_3 for code, data in self.iso3166_data.items() if data.alpha_3}
         }
     
-    def save_metadata(self, current_df, historical_df):
+    def write_csv(self, path: str, fieldnames: List[str], rows: List[Dict]):
+        """Write rows to a CSV file with the given column order"""
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(rows)
+    
+    def write_json(self, path: str, data: Dict, pretty: bool = True):
+        """Write data as UTF-8 JSON, indented for readability or compact for machine consumption"""
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+            return
+        
+        with open(path, 'w', encoding='utf-8') as f:
+            if pretty:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    
+    def save_metadata(self, current_rows, historical_rows):
         """Save metadata about the update process"""
         metadata = {
             'last_updated': datetime.now(timezone.utc).isoformat(),
-            'total_regions': len(current_df),
-            'total_records': len(historical_df),
+            'total_regions': len(current_rows),
+            'total_records': len(historical_rows),
             'generator_version': GENERATOR_VERSION
         }
         
-        with open('data/metadata.json', 'w') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        self.write_json('data/metadata.json', metadata, pretty=False)
     
     def run(self):
         """Main execution function"""
@@ -325,50 +349,52 @@ class CurrencyDataProcessor:
         # Initialize output directory
         os.makedirs('data', exist_ok=True)
         
-        # Load reference data from official sources
-        logger.info("Fetching ISO 3166 data...")
-        self.iso3166_data = self.fetch_iso3166_data()
-        
-        logger.info("Fetching ISO 4217 data...")
-        self.iso4217_data = self.fetch_iso4217_data()
+        # Load reference data from official sources while the live currency-country
+        # mappings are downloaded from Unicode CLDR
+        logger.info("Fetching ISO 3166, ISO 4217 and CLDR currency data...")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            iso3166_future = executor.submit(self.fetch_iso3166_data)
+            iso4217_future = executor.submit(self.fetch_iso4217_data)
+            cldr_future = executor.submit(self.fetch_cldr_currency_data)
+            
+            self.iso3166_data = iso3166_future.result()
+            self.iso4217_data = iso4217_future.result()
+            xml_stream = cldr_future.result()
         
-        # Fetch live currency-country mappings from Unicode CLDR
-        logger.info("Fetching CLDR currency data...")
-        xml_content = self.fetch_cldr_currency_data()
+        # Flat code -> name lookup for the row-building pass
+        self.iso4217_names = {code: info.name for code, info in self.iso4217_data.items()}
         
         logger.info("Parsing currency data...")
-        self.currency_regions = self.parse_currency_xml(xml_content)
+        with xml_stream:
+            self.currency_regions = self.parse_currency_xml(xml_stream)
         
         # Generate output files in multiple formats
-        logger.info("Generating current currencies CSV...")
-        current_df = self.generate_current_currencies_csv(self.currency_regions)
-        current_df.to_csv('data/current_currencies.csv', index=False)
-        
-        logger.info("Generating historical currencies CSV (all currencies with timeline)...")
-        historical_df = self.generate_historical_currencies_csv(self.currency_regions)
-        historical_df.to_csv('data/historical_currencies.csv', index=False)
-        
-        logger.info("Generating current currencies JSON...")
-        current_json = self.generate_current_currencies_json(self.currency_regions)
-        with open('data/current_currencies.json', 'w') as f:
-            json.dump(current_json, f, indent=2, ensure_ascii=False)
-        
-        logger.info("Generating historical currencies JSON...")
-        historical_json = self.generate_historical_currencies_json(self.currency_regions)
-        with open('data/historical_currencies.json', 'w') as f:
-            json.dump(historical_json, f, indent=2, ensure_ascii=False)
+        logger.info("Generating current and historical currency data...")
+        current_rows, historical_rows, current_json, historical_json = self.build_all_outputs(self.currency_regions)
         
         logger.info("Generating ISO mappings...")
         iso_mappings = self.generate_iso_mappings()
-        with open('data/iso_mappings.json', 'w') as f:
-            json.dump(iso_mappings, f, indent=2, ensure_ascii=False)
+        
+        # Encoding and disk I/O of independent files overlap on worker threads
+        logger.info("Writing CSV and JSON output files...")
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [
+                executor.submit(self.write_csv, 'data/current_currencies.csv', CURRENT_CSV_FIELDS, current_rows),
+                executor.submit(self.write_csv, 'data/historical_currencies.csv', HISTORICAL_CSV_FIELDS, historical_rows),
+                executor.submit(self.write_json, 'data/current_currencies.json', current_json),
+                executor.submit(self.write_json, 'data/historical_currencies.json', historical_json),
+                executor.submit(self.write_json, 'data/iso_mappings.json', iso_mappings, pretty=False)
+            ]
+            # Re-raise any write failure before metadata is recorded
+            for future in futures:
+                future.result()
         
         logger.info("Saving metadata...")
-        self.save_metadata(current_df, historical_df)
+        self.save_metadata(current_rows, historical_rows)
         
         logger.info(f"Process completed successfully!")
-        logger.info(f"- Current currencies: {len(current_df)} regions")
-        logger.info(f"- Historical currencies: {len(historical_df)} records")
+        logger.info(f"- Current currencies: {len(current_rows)} regions")
+        logger.info(f"- Historical currencies: {len(historical_rows)} records")
 
 def main():
     """Main entry point"""